@@ -5,7 +5,7 @@ from flask import abort, request, url_for, redirect
 from werkzeug.contrib.atom import AtomFeed
 
 from udata.core.site.models import current_site
-from udata.frontend.views import DetailView, SearchView
+from udata.frontend.views import DetailView, Paginated, SearchView
 from udata.i18n import I18nBlueprint, lazy_gettext as _
 from udata.models import Dataset, Follow, Reuse, CommunityResource
 from udata.rdf import (
@@ -114,13 +114,15 @@ class DatasetDetailView(DatasetView, DetailView):
 
 
 @blueprint.route('/<dataset:dataset>/followers/', endpoint='followers')
-class DatasetFollowersView(DatasetView, DetailView):
+class DatasetFollowersView(DatasetView, Paginated, DetailView):
     template_name = 'dataset/followers.html'
+    default_page_size = 21
 
     def get_context(self):
         context = super(DatasetFollowersView, self).get_context()
-        context['followers'] = (Follow.objects.followers(self.dataset)
-                                              .order_by('follower.fullname'))
+        context['followers'] = (Follow.objects.sorted_followers(self.dataset)
+                                              .paginate(self.page,
+                                                        self.page_size))
         return context
 
 
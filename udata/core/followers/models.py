@@ -3,6 +3,7 @@ from __future__ import unicode_literals
 
 from datetime import datetime
 
+from udata.app import cache
 from udata.models import db
 
 from .signals import on_follow, on_unfollow
@@ -10,20 +11,95 @@ from .signals import on_follow, on_unfollow
 
 __all__ = ('Follow', )
 
+FOLLOWERS_CACHE_KEY = 'followers-{0}-{1}'
+
+
+def followers_cache_key(class_name, id):
+    return FOLLOWERS_CACHE_KEY.format(class_name.lower(), id)
+
 
 class FollowQuerySet(db.BaseQuerySet):
     def following(self, user):
         return self(follower=user, until=None)
 
+    def following_grouped(self, user):
+        '''
+        Get the identifiers of the objects followed by a given user
+        grouped by class name in a single aggregation round trip.
+
+        :returns: a dict mapping class names to lists of identifiers
+        '''
+        pipeline = [
+            {'$group': {'_id': '$following._cls',
+                        'refs': {'$push': '$following._ref'}}},
+        ]
+        return dict(
+            (group['_id'], [ref.id for ref in group['refs']])
+            for group in self.following(user).aggregate(*pipeline)
+        )
+
     def followers(self, user):
         return self(following=user, until=None)
 
+    def sorted_followers(self, obj):
+        '''
+        Get the active followers of an object sorted by name.
+
+        Only the fields needed for listings are loaded, so the followed
+        object itself is not dereferenced again for each follow.
+        '''
+        return (self.followers(obj).only('follower', 'since')
+                                   .order_by('follower_fullname'))
+
+    def cached_followers(self, obj):
+        '''
+        Get the sorted followers of an object with their users dereferenced.
+
+        Only the sorted followers identifiers and follow dates are cached,
+        users are always fetched in a single query to stay up to date.
+        The cache is dropped when someone follows or unfollows the object
+        and when a follower is renamed or deleted.
+
+        :returns: a list of unsaved Follow documents
+        '''
+        key = followers_cache_key(obj._class_name, obj.id)
+        follows = cache.get(key)
+        if follows is None:
+            follows = [
+                (follow['follower'], follow['since'])
+                for follow in self.sorted_followers(obj).as_pymongo()
+            ]
+            cache.set(key, follows)
+        user_class = self._document.follower.document_type
+        users = user_class.objects.in_bulk([id for id, _ in follows])
+        return [
+            self._document(follower=users[id], following=obj, since=since)
+            for id, since in follows if id in users
+        ]
+
+    def cached_followers_keys(self):
+        '''Cache keys of the followers of objects followed in this queryset'''
+        return [
+            followers_cache_key(follow['following']['_cls'],
+                                follow['following']['_ref'].id)
+            for follow in self.only('following').as_pymongo()
+            if 'following' in follow
+        ]
+
+    def invalidate_cached_followers(self):
+        '''Drop the cached followers of objects followed in this queryset'''
+        keys = self.cached_followers_keys()
+        if keys:
+            cache.delete_many(*keys)
+
     def is_following(self, user, following):
         return self(follower=user, following=following, until=None).count() > 0
 
 
 class Follow(db.Document):
     follower = db.ReferenceField('User', required=True)
+    # Denormalized to sort followers without dereferencing them
+    follower_fullname = db.StringField()
     following = db.GenericReferenceField()
     since = db.DateTimeField(required=True, default=datetime.now)
     until = db.DateTimeField()
@@ -33,11 +109,15 @@ class Follow(db.Document):
             'follower',
             'following',
             ('follower', 'until'),
-            ('following', 'until'),
+            ('following', 'until', 'follower_fullname'),
         ],
         'queryset_class': FollowQuerySet,
     }
 
+    def clean(self):
+        if self.follower and not self.follower_fullname:
+            self.follower_fullname = self.follower.fullname
+
 
 @db.post_save.connect
 def emit_new_follower(sender, document, **kwargs):
@@ -46,3 +126,10 @@ def emit_new_follower(sender, document, **kwargs):
             on_unfollow.send(document)
         else:
             on_follow.send(document)
+
+
+@on_follow.connect
+@on_unfollow.connect
+def invalidate_cached_followers(follow):
+    following = follow.following
+    cache.delete(followers_cache_key(following._class_name, following.id))
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+from flask import request
+
 from udata.auth import current_user
 
 from udata.i18n import I18nBlueprint
@@ -15,4 +17,13 @@ blueprint = I18nBlueprint('followers', __name__)
 def is_following(obj):
     if not current_user.is_authenticated:
         return False
-    return Follow.objects.is_following(current_user._get_current_object(), obj)
+    # Memoize per request as the same object can be rendered many times.
+    # The request is used instead of `g` which may outlive a single request.
+    if not hasattr(request, '_is_following'):
+        request._is_following = {}
+    cache = request._is_following
+    key = getattr(obj, 'id', None) or id(obj)
+    if key not in cache:
+        cache[key] = Follow.objects.is_following(
+            current_user._get_current_object(), obj)
+    return cache[key]
@@ -78,12 +78,10 @@ class OrganizationDetailView(OrgView, DetailView):
 
         datasets = Dataset.objects(organization=self.organization).visible()
         reuses = Reuse.objects(organization=self.organization).visible()
-        followers = (Follow.objects.followers(self.organization)
-                                   .order_by('follower.fullname'))
         context.update({
             'reuses': reuses.paginate(1, self.page_size),
             'datasets': datasets.paginate(1, self.page_size),
-            'followers': followers,
+            'followers': Follow.objects.cached_followers(self.organization),
             'can_edit': can_edit,
             'can_view': can_view,
             'private_reuses': (
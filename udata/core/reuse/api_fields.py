@@ -12,6 +12,12 @@ from .models import REUSE_TYPES, IMAGE_SIZES
 
 BIGGEST_IMAGE_SIZE = IMAGE_SIZES[0]
 
+REUSE_TYPES_KEYS = tuple(REUSE_TYPES.keys())
+
+
+def reuse_url_params(reuse):
+    return {'reuse': reuse}
+
 
 reuse_fields = api.model('Reuse', {
     'id': fields.String(description='The reuse identifier', readonly=True),
@@ -19,7 +25,7 @@ reuse_fields = api.model('Reuse', {
     'slug': fields.String(
         description='The reuse permalink string', readonly=True),
     'type': fields.String(
-        description='The reuse type', required=True, enum=REUSE_TYPES.keys()),
+        description='The reuse type', required=True, enum=REUSE_TYPES_KEYS),
     'url': fields.String(
         description='The reuse remote URL (website)', required=True),
     'description': fields.Markdown(
@@ -53,10 +59,10 @@ reuse_fields = api.model('Reuse', {
         allow_null=True),
     'metrics': fields.Raw(description='The reuse metrics', readonly=True),
     'uri': fields.UrlFor(
-        'api.reuse', lambda o: {'reuse': o},
+        'api.reuse', reuse_url_params,
         description='The reuse API URI', readonly=True),
     'page': fields.UrlFor(
-        'reuses.show', lambda o: {'reuse': o},
+        'reuses.show', reuse_url_params,
         description='The reuse page URL', readonly=True),
 })
 
@@ -83,10 +89,10 @@ reuse_ref_fields = api.inherit('ReuseReference', base_reference, {
         description='The reuse thumbnail thumbnail URL. This is the square '
         '({0}x{0}) and cropped version.'.format(BIGGEST_IMAGE_SIZE)),
     'uri': fields.UrlFor(
-        'api.reuse', lambda o: {'reuse': o},
+        'api.reuse', reuse_url_params,
         description='The reuse API URI', readonly=True),
     'page': fields.UrlFor(
-        'reuses.show', lambda o: {'reuse': o},
+        'reuses.show', reuse_url_params,
         description='The reuse page URL', readonly=True),
 })
 
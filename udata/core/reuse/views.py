@@ -92,11 +92,8 @@ class ReuseDetailView(ReuseView, DetailView):
         if self.reuse.deleted and not ReuseEditPermission(self.reuse).can():
             abort(410)
 
-        followers = (Follow.objects.followers(self.reuse)
-                     .order_by('follower.fullname'))
-
         context.update(
-            followers=followers,
+            followers=Follow.objects.cached_followers(self.reuse),
             can_edit=ReuseEditPermission(self.reuse),
         )
 
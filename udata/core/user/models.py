@@ -15,6 +15,7 @@ from itsdangerous import JSONWebSignatureSerializer
 from werkzeug import cached_property
 
 from udata import mail
+from udata.app import cache
 from udata.frontend.markdown import mdstrip
 from udata.i18n import lazy_gettext as _
 from udata.models import db, WithMetrics, Follow
@@ -182,10 +183,19 @@ class User(WithMetrics, UserMixin, db.Document):
 
     @classmethod
     def pre_save(cls, sender, document, **kwargs):
+        changed_fields = getattr(document, '_changed_fields', [])
+        document._fullname_changed = (
+            'first_name' in changed_fields or 'last_name' in changed_fields)
         cls.before_save.send(document)
 
     @classmethod
     def post_save(cls, sender, document, **kwargs):
+        if getattr(document, '_fullname_changed', False):
+            # Keep the denormalized follower name in sync
+            follows = Follow.objects(follower=document)
+            follows.update(set__follower_fullname=document.fullname)
+            # Cached followers are sorted by name
+            follows.invalidate_cached_followers()
         cls.after_save.send(document)
         if kwargs.get('created'):
             cls.on_create.send(document)
@@ -235,7 +245,11 @@ class User(WithMetrics, UserMixin, db.Document):
                 if message.posted_by == self:
                     message.content = 'DELETED'
             discussion.save()
-        Follow.objects(follower=self).delete()
+        follows = Follow.objects(follower=self)
+        cached_followers_keys = follows.cached_followers_keys()
+        follows.delete()
+        if cached_followers_keys:
+            cache.delete_many(*cached_followers_keys)
         Follow.objects(following=self).delete()
         mail.send(_('Account deletion'), copied_user, 'account_deleted')
 
@@ -6,7 +6,7 @@ import logging
 from flask import abort, g
 from flask_security import current_user
 
-from udata.frontend.views import DetailView
+from udata.frontend.views import DetailView, Paginated
 from udata.models import User, Activity, Organization, Dataset, Reuse, Follow
 from udata.i18n import I18nBlueprint
 
@@ -77,45 +77,42 @@ class UserActivityView(UserView, DetailView):
         return context
 
 
+#: Followed objects context variable and ordering by followed class name
+FOLLOWED = {
+    'Dataset': ('followed_datasets', Dataset, ('title',)),
+    'Reuse': ('followed_reuses', Reuse, ('title',)),
+    'Organization': ('followed_organizations', Organization, ('name',)),
+    'User': ('followed_users', User, ('first_name', 'last_name')),
+}
+
+
 @blueprint.route('/<user:user>/following/', endpoint='following')
 class UserFollowingView(UserView, DetailView):
     template_name = 'user/following.html'
 
     def get_context(self):
         context = super(UserFollowingView, self).get_context()
-        datasets, reuses, organizations, users = [], [], [], []
-
-        for follow in Follow.objects.following(self.user).select_related():
-            if isinstance(follow.following, Organization):
-                organizations.append(follow.following)
-            elif isinstance(follow.following, Reuse):
-                reuses.append(follow.following)
-            elif isinstance(follow.following, Dataset):
-                datasets.append(follow.following)
-            elif isinstance(follow.following, User):
-                users.append(follow.following)
-            else:
-                log.warning(
-                    'Follow object %s has not dereferenced %s',
-                    follow.id, follow.following)
-
-        context.update({
-            'followed_datasets': sorted(datasets, key=lambda d: d.title),
-            'followed_reuses': sorted(reuses, key=lambda r: r.title),
-            'followed_organizations': sorted(organizations,
-                                             key=lambda o: o.name),
-            'followed_users': sorted(users, key=lambda u: u.fullname),
-        })
+        context.update((name, []) for name, _, _ in FOLLOWED.values())
+
+        following = Follow.objects.following_grouped(self.user)
+        for cls, ids in following.items():
+            if cls not in FOLLOWED:
+                log.warning('Unsupported followed class %s', cls)
+                continue
+            name, model, order = FOLLOWED[cls]
+            context[name] = list(model.objects(id__in=ids).order_by(*order))
 
         return context
 
 
 @blueprint.route('/<user:user>/followers/', endpoint='followers')
-class UserFollowersView(UserView, DetailView):
+class UserFollowersView(UserView, Paginated, DetailView):
     template_name = 'user/followers.html'
+    default_page_size = 21
 
     def get_context(self):
         context = super(UserFollowersView, self).get_context()
-        context['followers'] = (Follow.objects.followers(self.user)
-                                              .order_by('follower.fullname'))
+        context['followers'] = (Follow.objects.sorted_followers(self.user)
+                                              .paginate(self.page,
+                                                        self.page_size))
         return context
@@ -48,21 +48,12 @@ class BaseView(MethodView):
         pass
 
 
-class ListView(Templated, BaseView):
+class Paginated(object):
     '''
-    Render a Queryset as a list.
+    Extract bounded pagination parameters from the query string.
     '''
-    model = None
-    context_name = 'objects'
     default_page_size = 20
-
-    def get_queryset(self):
-        return self.model.objects
-
-    def get_context(self):
-        context = super(ListView, self).get_context()
-        context[self.context_name] = self.get_queryset()
-        return context
+    max_page_size = 100
 
     @property
     def page(self):
@@ -78,11 +69,28 @@ class ListView(Templated, BaseView):
         try:
             params_page_size = request.args.get('page_size',
                                                 self.default_page_size)
-            return int(params_page_size or self.default_page_size)
+            page_size = int(params_page_size or self.default_page_size)
+            return min(max(page_size, 1), self.max_page_size)
         except ValueError:  # Cast exception
             # Failsafe, if page_size cannot be parsed, we falback on default
             return self.default_page_size
 
+
+class ListView(Paginated, Templated, BaseView):
+    '''
+    Render a Queryset as a list.
+    '''
+    model = None
+    context_name = 'objects'
+
+    def get_queryset(self):
+        return self.model.objects
+
+    def get_context(self):
+        context = super(ListView, self).get_context()
+        context[self.context_name] = self.get_queryset()
+        return context
+
     def get(self, **kwargs):
         return self.render()
 
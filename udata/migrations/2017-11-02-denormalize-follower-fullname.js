@@ -0,0 +1,25 @@
+/*
+ * Denormalize the follower full name on follows to sort followers
+ * and drop the (following, until) index, now a prefix of the
+ * (following, until, follower_fullname) one.
+ */
+
+var nbUpdated = 0;
+
+db.follow.distinct('follower', {follower_fullname: {$exists: false}}).forEach(userId => {
+    const user = db.user.findOne({_id: userId}, {first_name: 1, last_name: 1});
+    if (!user) return;
+    const fullname = [user.first_name || '', user.last_name || ''].join(' ').trim();
+    const result = db.follow.updateMany(
+        {follower: userId, follower_fullname: {$exists: false}},
+        {$set: {follower_fullname: fullname}}
+    );
+    nbUpdated += result.modifiedCount;
+});
+
+print(`Denormalized the follower full name on ${nbUpdated} follow(s).`);
+
+if (db.follow.getIndexes().some(index => index.name === 'following_1_until_1')) {
+    db.follow.dropIndex('following_1_until_1');
+    print('Dropped the redundant following_1_until_1 index.');
+}
@@ -5,7 +5,6 @@ from bson import ObjectId
 from uuid import UUID
 
 from flask import request
-from mongoengine.errors import InvalidQueryError
 from werkzeug.routing import BaseConverter, NotFound, PathConverter
 
 from udata import models
@@ -59,11 +58,13 @@ class ModelConverter(BaseConverter):
 
     model = None
 
+    def __init__(self, map, *args, **kwargs):
+        super(ModelConverter, self).__init__(map, *args, **kwargs)
+        # Resolved once per rule instead of failing a query on each request
+        self.has_slug = self.model is not None and 'slug' in self.model._fields
+
     def to_python(self, value):
-        try:
-            obj = self.model.objects(slug=value).first()
-        except InvalidQueryError:  # If the model doesn't have a slug.
-            obj = None
+        obj = self.model.objects(slug=value).first() if self.has_slug else None
         try:
             return obj or self.model.objects.get_or_404(id=value)
         except NotFound as e:
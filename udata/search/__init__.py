@@ -211,16 +211,19 @@ def multisearch(*models, **params):
     queries = []
     for model in models:
         s = search_for(model, **params)
-        ms = ms.add(s._s)
-        queries.append(s)
+        searches = s.searches()
+        for search in searches:
+            ms = ms.add(search)
+        queries.append((s, len(searches)))
     responses = ms.execute()
-    return [
-        # _d_ is the only way to access the raw data
-        # allowing to rewrap response in a FacetedSearch
+    results = []
+    start = 0
+    for query, nb in queries:
+        # Rewrap raw responses in a SearchResult
         # because default multisearch loose facets
-        SearchResult(query, response._d_)
-        for query, response in zip(queries, responses)
-    ]
+        results.append(query.result_from(responses[start:start + nb]))
+        start += nb
+    return results
 
 
 def suggest(q, field, size=10):
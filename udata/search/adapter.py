@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-import itertools
 import logging
+import re
 
 from elasticsearch_dsl import DocType, Integer, Float, Object
 from flask_restplus.reqparse import RequestParser
@@ -13,6 +13,11 @@ from udata.core.metrics import Metric
 
 log = logging.getLogger(__name__)
 
+RE_TOKEN_SEPARATOR = re.compile("[ '\u2019]")
+
+# FacetedSearch classes cache, keyed by (adapter, facets)
+_facet_searches = {}
+
 
 class ModelSearchAdapter(DocType):
     """This class allow to describe and customize the search behavior."""
@@ -53,10 +58,8 @@ class ModelSearchAdapter(DocType):
     @classmethod
     def completer_tokenize(cls, value, min_length=3):
         '''Quick and dirty tokenizer for completion suggester'''
-        tokens = list(itertools.chain(*[
-            [m for m in n.split("'") if len(m) > min_length]
-            for n in value.split(' ')
-        ]))
+        tokens = [t for t in RE_TOKEN_SEPARATOR.split(value)
+                  if len(t) > min_length]
         return list(set([value] + tokens + [' '.join(tokens)]))
 
     @classmethod
@@ -71,7 +74,16 @@ class ModelSearchAdapter(DocType):
         As we don't use them every time and facet computation
         can take some time, we build the FacetedSearch
         dynamically with only those requested.
+
+        Built classes are cached per adapter and facets selection.
         '''
+        key = (cls, frozenset(facets))
+        if key not in _facet_searches:
+            _facet_searches[key] = cls._build_facet_search(facets)
+        return _facet_searches[key]
+
+    @classmethod
+    def _build_facet_search(cls, facets):
         f = dict((k, v) for k, v in cls.facets.items() if k in facets)
 
         class TempSearch(SearchQuery):
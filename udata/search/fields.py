@@ -2,6 +2,7 @@
 from __future__ import unicode_literals
 
 import logging
+import math
 import re
 
 from datetime import date
@@ -31,7 +32,8 @@ __all__ = (
 
 ES_NUM_FAILURES = '-Infinity', 'Infinity', 'NaN', None
 
-RE_TIME_COVERAGE = re.compile(r'\d{4}-\d{2}-\d{2}-\d{4}-\d{2}-\d{2}')
+RE_TIME_COVERAGE = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})-(\d{4})-(\d{2})-(\d{2})')
 
 OR_SEPARATOR = '|'
 OR_LABEL = _('OR')
@@ -136,15 +138,15 @@ class ModelTermsFacet(TermsFacet):
         selected or not.
         """
         values = super(ModelTermsFacet, self).get_values(data, filter_values)
-        ids = [key for (key, doc_count, selected) in values]
         # Perform a model resolution: models are feched from DB
-        # We use model field to cast IDs
-        ids = map(self.model_field.to_mongo, ids)
+        # in a single query. We use model field to cast IDs
+        ids = [self.model_field.to_mongo(key)
+               for key, _count, _selected in values]
         objects = self.model.objects.in_bulk(ids)
 
         return [
-            (objects.get(self.model_field.to_mongo(key)), doc_count, selected)
-            for (key, doc_count, selected) in values
+            (objects.get(obj_id), doc_count, selected)
+            for obj_id, (_key, doc_count, selected) in zip(ids, values)
         ]
 
     def default_labelizer(self, value):
@@ -227,13 +229,20 @@ def get_value(data, name):
     return getattr(wrapper, 'value')
 
 
+def is_num_failure(value):
+    '''Whether a numeric aggregation value is empty or invalid'''
+    if isinstance(value, float):
+        return math.isinf(value) or math.isnan(value)
+    return value in ES_NUM_FAILURES
+
+
 class TemporalCoverageFacet(Facet, DSLFacet):
     agg_type = 'nested'
 
     def parse_value(self, value):
-        parts = value.split('-')
-        start = date(*map(int, parts[0:3]))
-        end = date(*map(int, parts[3:6]))
+        parts = map(int, RE_TIME_COVERAGE.match(value).groups())
+        start = date(*parts[0:3])
+        end = date(*parts[3:6])
         return start, end
 
     def default_labelizer(self, value):
@@ -266,6 +275,9 @@ class TemporalCoverageFacet(Facet, DSLFacet):
         min_value = get_value(data, 'min_start'.format(field))
         max_value = get_value(data, 'max_end'.format(field))
 
+        # Empty aggregations return infinite values
+        if is_num_failure(min_value) or is_num_failure(max_value):
+            return None
         if not (min_value and max_value):
             return None
 
@@ -303,13 +315,23 @@ class BoolBooster(object):
 
 
 class FunctionBooster(object):
-    def __init__(self, function):
+    '''
+    A script score booster.
+
+    Variable values should be given as params
+    to keep the script source stable and cached by Elasticsearch.
+    '''
+    def __init__(self, function, **params):
         self.function = function
+        self.params = params
 
     def to_query(self):
+        script = self.function
+        if self.params:
+            script = {'inline': self.function, 'params': self.params}
         return {
             'script_score': {
-                'script': self.function,
+                'script': script,
             },
         }
 
@@ -323,11 +345,6 @@ class ValueFactor(object):
         return {'field_value_factor': self.params}
 
 
-def _v(value):
-    '''Call value if necessary'''
-    return value() if callable(value) else value
-
-
 class DecayFunction(object):
     function = None
 
@@ -337,16 +354,21 @@ class DecayFunction(object):
         self.scale = scale or origin
         self.offset = offset
         self.decay = decay
+        params = [('origin', self.origin), ('scale', self.scale)]
+        if offset:
+            params.append(('offset', offset))
+        if decay:
+            params.append(('decay', decay))
+        # Static values are resolved once, callables on each query
+        self._static_params = dict(
+            (k, v) for k, v in params if not callable(v)
+        )
+        self._callable_params = [(k, v) for k, v in params if callable(v)]
 
     def to_query(self):
-        params = {
-            'origin': _v(self.origin),
-            'scale': _v(self.scale),
-        }
-        if self.offset:
-            params['offset'] = _v(self.offset)
-        if self.decay:
-            params['decay'] = _v(self.decay)
+        params = self._static_params.copy()
+        for key, func in self._callable_params:
+            params[key] = func()
 
         return {
             self.function: {
@@ -9,7 +9,7 @@ from functools import partial
 from flask import request
 from werkzeug.urls import Href
 
-from elasticsearch_dsl import Search, FacetedSearch, Q
+from elasticsearch_dsl import Search, MultiSearch, FacetedSearch, Q
 from elasticsearch_dsl.aggs import Bucket, Pipeline
 from elasticsearch_dsl.query import FunctionScore
 
@@ -150,6 +150,51 @@ class SearchQuery(FacetedSearch):
         s = s.fields([])
         return s
 
+    def split_search(self):
+        '''
+        Split the search into an aggregations only search
+        and a hits only search.
+
+        Aggregations only searches (ie. ``size=0``) can be served
+        from the Elasticsearch shard request cache
+        whereas hits change with sort and pagination.
+        '''
+        aggs = self._s.sort()[0:0].params(request_cache=True)
+        hits = self._s._clone()
+        hits.aggs._params = {}
+        return aggs, hits
+
+    def searches(self):
+        '''
+        The searches to send to fetch this query results.
+
+        Aggregations and hits are fetched separately
+        when facets are requested (see ``split_search``).
+        '''
+        return self.split_search() if self.facets else (self._s,)
+
+    def result_from(self, responses):
+        '''Build a SearchResult from the ``searches`` responses'''
+        # _d_ is the only way to access the raw data
+        data = responses[-1]._d_
+        if self.facets:
+            data['aggregations'] = responses[0]._d_.get('aggregations', {})
+        return SearchResult(self, data)
+
+    def execute(self):
+        '''
+        Execute the search.
+
+        When facets are requested, aggregations and hits
+        are fetched by two queries sent in a single multisearch.
+        '''
+        if not self.facets:
+            return super(SearchQuery, self).execute()
+        ms = MultiSearch(using=es.client, index=es.index_name)
+        for search in self.searches():
+            ms = ms.add(search)
+        return self.result_from(ms.execute())
+
     def multi_match(self, terms):
         params = {'query': ' '.join(terms)}
         # Optionnal search type
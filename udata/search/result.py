@@ -1,12 +1,9 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-import copy
 import logging
 
 from bson.objectid import ObjectId
-from flask import request
-from werkzeug.urls import Href
 
 from elasticsearch_dsl.result import Response
 
@@ -23,6 +20,7 @@ class SearchResult(Paginable, Response):
         self.query = query
         self._objects = None
         self._facets = None
+        self._pages = None
 
     @property
     def query_string(self):
@@ -53,6 +51,12 @@ class SearchResult(Paginable, Response):
         except (KeyError, AttributeError):
             return 0
 
+    @property
+    def pages(self):
+        if self._pages is None:
+            self._pages = super(SearchResult, self).pages
+        return self._pages
+
     @property
     def page(self):
         return (self.query.page or 1) if self.pages else 1
@@ -66,8 +70,9 @@ class SearchResult(Paginable, Response):
         return self.query.adapter.model.__name__
 
     def get_ids(self):
+        # Read raw hits to avoid wrapping each of them into a Result
         try:
-            return [hit['_id'] for hit in self.hits.hits]
+            return [hit['_id'] for hit in self._d_['hits']['hits']]
         except KeyError:
             return []
 
@@ -90,7 +95,7 @@ class SearchResult(Paginable, Response):
             yield obj
 
     def __len__(self):
-        return len(self.hits.hits)
+        return len(self._d_['hits']['hits'])
 
     def __getitem__(self, index):
         return self.get_objects()[index]
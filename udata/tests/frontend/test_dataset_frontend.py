@@ -315,3 +315,29 @@ class DatasetBlueprintTest(FrontTestCase):
         self.assert200(response)
         rendered_followers = self.get_context_variable('followers')
         self.assertEqual(len(rendered_followers), len(followers))
+
+    def test_dataset_followers_paginated(self):
+        '''It should paginate the dataset followers list page'''
+        dataset = DatasetFactory()
+        for _ in range(4):
+            Follow.objects.create(follower=UserFactory(), following=dataset)
+
+        response = self.get(url_for('datasets.followers', dataset=dataset,
+                                    page=2, page_size=3))
+
+        self.assert200(response)
+        rendered_followers = self.get_context_variable('followers')
+        self.assertEqual(rendered_followers.total, 4)
+        self.assertEqual(rendered_followers.page, 2)
+        self.assertEqual(len(rendered_followers), 1)
+
+    def test_dataset_followers_max_page_size(self):
+        '''It should bound the dataset followers page size'''
+        dataset = DatasetFactory()
+
+        response = self.get(url_for('datasets.followers', dataset=dataset,
+                                    page_size=100000))
+
+        self.assert200(response)
+        rendered_followers = self.get_context_variable('followers')
+        self.assertEqual(rendered_followers.page_size, 100)
@@ -100,6 +100,35 @@ class UserBlueprintTest(FrontTestCase):
         rendered_followers = self.get_context_variable('followers')
         self.assertEqual(len(rendered_followers), len(followers))
 
+    def test_render_profile_followers_paginated(self):
+        '''It should paginate the user profile followers page'''
+        user = UserFactory()
+        for _ in range(4):
+            Follow.objects.create(follower=UserFactory(), following=user)
+        response = self.get(url_for('users.followers', user=user,
+                                    page=2, page_size=3))
+
+        self.assert200(response)
+
+        rendered_followers = self.get_context_variable('followers')
+        self.assertEqual(rendered_followers.total, 4)
+        self.assertEqual(rendered_followers.page, 2)
+        self.assertEqual(len(rendered_followers), 1)
+
+    def test_render_profile_followers_bounded_pagination(self):
+        '''It should clamp invalid followers pagination parameters'''
+        user = UserFactory()
+        Follow.objects.create(follower=UserFactory(), following=user)
+        response = self.get(url_for('users.followers', user=user,
+                                    page=0, page_size=-1))
+
+        self.assert200(response)
+
+        rendered_followers = self.get_context_variable('followers')
+        self.assertEqual(rendered_followers.page, 1)
+        self.assertEqual(rendered_followers.page_size, 1)
+        self.assertEqual(len(rendered_followers), 1)
+
     def test_render_profile_following_empty(self):
         '''It should render an empty user profile following page'''
         user = UserFactory()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import pickle
+
+import mock
+
+from udata.app import cache
+from udata.core.dataset.factories import DatasetFactory
+from udata.core.followers.models import FollowQuerySet, followers_cache_key
+from udata.core.organization.factories import OrganizationFactory
+from udata.core.user.factories import UserFactory
+from udata.models import Follow
+from udata.settings import Testing
+
+from udata.tests import TestCase, DBTestMixin
+
+
+class FollowModelTest(DBTestMixin, TestCase):
+    def test_follower_fullname_denormalized_on_create(self):
+        user = UserFactory(first_name='John', last_name='Doe')
+        follow = Follow.objects.create(follower=user,
+                                       following=DatasetFactory())
+        self.assertEqual(follow.follower_fullname, 'John Doe')
+
+    def test_follower_fullname_denormalized_from_id(self):
+        user = UserFactory(first_name='John', last_name='Doe')
+        follow = Follow.objects.create(follower=user.id,
+                                       following=DatasetFactory())
+        self.assertEqual(follow.reload().follower_fullname, 'John Doe')
+
+    def test_follower_fullname_updated_on_rename(self):
+        user = UserFactory(first_name='John', last_name='Doe')
+        follow = Follow.objects.create(follower=user,
+                                       following=DatasetFactory())
+
+        user.first_name = 'Jane'
+        user.save()
+
+        self.assertEqual(follow.reload().follower_fullname, 'Jane Doe')
+
+    def test_followers_sorted_by_fullname(self):
+        dataset = DatasetFactory()
+        for first_name in 'Charlie', 'Alice', 'Bob':
+            Follow.objects.create(follower=UserFactory(first_name=first_name),
+                                  following=dataset)
+
+        followers = Follow.objects.followers(dataset).order_by(
+            'follower_fullname')
+
+        self.assertEqual([f.follower.first_name for f in followers],
+                         ['Alice', 'Bob', 'Charlie'])
+
+
+class CacheSettings(Testing):
+    CACHE_TYPE = 'simple'
+
+
+class CachedFollowersTest(DBTestMixin, TestCase):
+    settings = CacheSettings
+
+    def follow(self, org, **kwargs):
+        user = UserFactory(**kwargs)
+        Follow.objects.create(follower=user, following=org)
+        return user
+
+    def names(self, org):
+        return [f.follower.first_name
+                for f in Follow.objects.cached_followers(org)]
+
+    def test_cache_hit(self):
+        org = OrganizationFactory()
+        self.follow(org, first_name='Bob')
+        self.follow(org, first_name='Alice')
+
+        self.assertEqual(self.names(org), ['Alice', 'Bob'])
+        with mock.patch.object(FollowQuerySet, 'sorted_followers') as query:
+            self.assertEqual(self.names(org), ['Alice', 'Bob'])
+        self.assertFalse(query.called)
+
+    def test_cached_value_is_plain_data(self):
+        org = OrganizationFactory()
+        user = self.follow(org)
+        Follow.objects.cached_followers(org)
+
+        cached = cache.get(followers_cache_key('Organization', org.id))
+
+        self.assertEqual(len(cached), 1)
+        self.assertEqual(cached[0][0], user.id)
+        self.assertEqual(pickle.loads(pickle.dumps(cached)), cached)
+
+    def test_invalidated_on_follow(self):
+        org = OrganizationFactory()
+        self.follow(org, first_name='Bob')
+        self.assertEqual(self.names(org), ['Bob'])
+
+        self.follow(org, first_name='Alice')
+
+        self.assertEqual(self.names(org), ['Alice', 'Bob'])
+
+    def test_invalidated_on_unfollow(self):
+        org = OrganizationFactory()
+        self.follow(org, first_name='Bob')
+        self.follow(org, first_name='Alice')
+        self.assertEqual(self.names(org), ['Alice', 'Bob'])
+
+        follow = Follow.objects.get(follower_fullname__startswith='Alice')
+        follow.until = follow.since
+        follow.save()
+
+        self.assertEqual(self.names(org), ['Bob'])
+
+    def test_invalidated_on_rename(self):
+        org = OrganizationFactory()
+        self.follow(org, first_name='Bob')
+        alice = self.follow(org, first_name='Alice')
+        self.assertEqual(self.names(org), ['Alice', 'Bob'])
+
+        alice.first_name = 'Carol'
+        alice.save()
+
+        self.assertEqual(self.names(org), ['Bob', 'Carol'])
+
+    def test_invalidated_on_user_deletion(self):
+        org = OrganizationFactory()
+        self.follow(org, first_name='Bob')
+        alice = self.follow(org, first_name='Alice')
+        self.assertEqual(self.names(org), ['Alice', 'Bob'])
+
+        alice.mark_as_deleted()
+
+        self.assertEqual(self.names(org), ['Bob'])
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+import itertools
+
 from datetime import date, timedelta
 
 import factory
@@ -31,7 +33,6 @@ class Fake(db.Document):
     title = db.StringField()
     description = db.StringField()
     tags = db.ListField(db.StringField())
-    other = db.ListField(db.StringField())
 
     meta = {'allow_inheritance': True}
 
@@ -144,6 +145,12 @@ def get_query(facet_search):
     return get_body(facet_search).get('query')
 
 
+def parse_url(url):
+    '''Parse an URL and return it with its flattened query string'''
+    parsed_url = url_parse(url)
+    return parsed_url, multi_to_dict(url_decode(parsed_url.query))
+
+
 def es_date(date):
     return float(date.toordinal())
 
@@ -155,9 +162,11 @@ class SearchTestCase(TestCase):
     maxDiff = None
 
     def assert_dict_equal(self, d1, d2, *args, **kwargs):
-        d1 = json.loads(json.dumps(d1))
-        d2 = json.loads(json.dumps(d2))
-        self.assertEqual(d1, d2, *args, **kwargs)
+        d1 = json.dumps(d1, sort_keys=True)
+        d2 = json.dumps(d2, sort_keys=True)
+        # Only perform the costly deep comparison on mismatch
+        if d1 != d2:
+            self.assertEqual(json.loads(d1), json.loads(d2), *args, **kwargs)
 
 
 class SearchQueryTest(SearchTestMixin, SearchTestCase):
@@ -460,6 +469,25 @@ class SearchQueryTest(SearchTestMixin, SearchTestCase):
             'script_score': {'script': 'doc["field"].value * 2'},
         })
 
+    def test_custom_function_scoring_with_params(self):
+        '''Search should handle field boosting by parametrized function'''
+        class FakeBoostedSearch(FakeSearch):
+            boosters = [
+                search.FunctionBooster('doc["field"].value * factor',
+                                       factor=2)
+            ]
+
+        query = search.search_for(FakeBoostedSearch)
+        body = get_body(query)
+        # Query should be wrapped in function_score
+        score_function = body['query']['function_score']['functions'][0]
+        self.assert_dict_equal(score_function, {
+            'script_score': {'script': {
+                'inline': 'doc["field"].value * factor',
+                'params': {'factor': 2},
+            }},
+        })
+
     def test_simple_query(self):
         '''A simple query should use query_string with specified fields'''
         search_query = search.search_for(FakeSearch, q='test')
@@ -580,6 +608,29 @@ class SearchQueryTest(SearchTestMixin, SearchTestCase):
             else:
                 self.assertNotIn(key, aggregations.keys())
 
+    def test_split_search(self):
+        search_query = search.search_for(FakeSearch, facets=True,
+                                         sort='title', page=2)
+        aggs, hits = search_query.split_search()
+
+        aggs_body = aggs.to_dict()
+        self.assertEqual(aggs_body['size'], 0)
+        self.assertNotIn('sort', aggs_body)
+        self.assertEqual(len(aggs_body['aggs']), len(FakeSearch.facets))
+        self.assertEqual(aggs._params, {'request_cache': True})
+
+        hits_body = hits.to_dict()
+        self.assertNotIn('aggs', hits_body)
+        self.assertEqual(hits_body['sort'], [{'title.raw': 'asc'}])
+        self.assertEqual(hits_body['from'], search.DEFAULT_PAGE_SIZE)
+
+    def test_execute_search_result_with_facets(self):
+        with self.autoindex():
+            FakeFactory(tags=['tag'])
+        result = search.query(FakeSearch, facets=True)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result.facets['tag'][0][0], 'tag')
+
     def test_to_url(self):
         kwargs = {
             'q': 'test',
@@ -590,11 +641,10 @@ class SearchQueryTest(SearchTestMixin, SearchTestCase):
         search_query = search.search_for(FakeSearch, **kwargs)
         with self.app.test_request_context('/an_url'):
             url = search_query.to_url()
-        parsed_url = url_parse(url)
-        qs = url_decode(parsed_url.query)
+        parsed_url, qs = parse_url(url)
 
         self.assertEqual(parsed_url.path, '/an_url')
-        self.assert_dict_equal(multi_to_dict(qs), {
+        self.assert_dict_equal(qs, {
             'q': 'test',
             'tag': ['tag1', 'tag2'],
             'page': '2',
@@ -609,11 +659,10 @@ class SearchQueryTest(SearchTestMixin, SearchTestCase):
         search_query = search.search_for(FakeSearch, **kwargs)
         with self.app.test_request_context('/an_url'):
             url = search_query.to_url(tag='tag3', other='value')
-        parsed_url = url_parse(url)
-        qs = url_decode(parsed_url.query)
+        parsed_url, qs = parse_url(url)
 
         self.assertEqual(parsed_url.path, '/an_url')
-        self.assert_dict_equal(multi_to_dict(qs), {
+        self.assert_dict_equal(qs, {
             'q': 'test',
             'tag': ['tag1', 'tag2', 'tag3'],
             'other': 'value',
@@ -628,11 +677,10 @@ class SearchQueryTest(SearchTestMixin, SearchTestCase):
         search_query = search.search_for(FakeSearch, **kwargs)
         with self.app.test_request_context('/an_url'):
             url = search_query.to_url(tag='tag3', other='value', replace=True)
-        parsed_url = url_parse(url)
-        qs = url_decode(parsed_url.query)
+        parsed_url, qs = parse_url(url)
 
         self.assertEqual(parsed_url.path, '/an_url')
-        self.assert_dict_equal(multi_to_dict(qs), {
+        self.assert_dict_equal(qs, {
             'q': 'test',
             'tag': 'tag3',
             'other': 'value',
@@ -647,11 +695,10 @@ class SearchQueryTest(SearchTestMixin, SearchTestCase):
         search_query = search.search_for(FakeSearch, **kwargs)
         with self.app.test_request_context('/an_url'):
             url = search_query.to_url(tag=None, other='value', replace=True)
-        parsed_url = url_parse(url)
-        qs = url_decode(parsed_url.query)
+        parsed_url, qs = parse_url(url)
 
         self.assertEqual(parsed_url.path, '/an_url')
-        self.assert_dict_equal(multi_to_dict(qs), {
+        self.assert_dict_equal(qs, {
             'q': 'test',
             'other': 'value',
         })
@@ -663,13 +710,11 @@ class SearchQueryTest(SearchTestMixin, SearchTestCase):
             'page': 2,
         }
         search_query = search.search_for(FakeSearch, **kwargs)
-        with self.app.test_request_context('/an_url'):
-            url = search_query.to_url('/another_url')
-        parsed_url = url_parse(url)
-        qs = url_decode(parsed_url.query)
+        url = search_query.to_url('/another_url')
+        parsed_url, qs = parse_url(url)
 
         self.assertEqual(parsed_url.path, '/another_url')
-        self.assert_dict_equal(multi_to_dict(qs), {
+        self.assert_dict_equal(qs, {
             'q': 'test',
             'tag': ['tag1', 'tag2'],
             'page': '2',
@@ -692,14 +737,23 @@ class TestMetricsMapping(SearchTestCase):
         })
 
 
+HIT_IDS = itertools.count()
+
+
 def hit_factory():
+    '''
+    Build a fake Elasticsearch hit.
+
+    Hits content is never inspected so it is cheaply generated
+    with a unique id.
+    '''
     return {
-        "_score": float(faker.random_number(2)),
+        "_score": 1.0,
         "_type": "fake",
-        "_id": faker.md5(),
+        "_id": '{0:032x}'.format(next(HIT_IDS)),
         "_source": {
-            "title": faker.sentence(),
-            "tags": [faker.word() for _ in range(faker.random_digit())]
+            "title": "title",
+            "tags": []
         },
         "_index": "udata-test"
     }
@@ -720,11 +774,8 @@ def response_factory(nb=20, total=42, **kwargs):
     Build a fake Elasticsearch DSL FacetedResponse
     and extract the facet form it
     '''
-    hits = sorted(
-        (hit_factory() for _ in range(nb)),
-        key=lambda h: h['_score']
-    )
-    max_score = hits[-1]['_score']
+    hits = [hit_factory() for _ in range(nb)]
+    max_score = max(hit['_score'] for hit in hits) if hits else 0
     data = {
         "hits": {
             "hits": hits,
@@ -748,9 +799,11 @@ class FacetTestCase(TestCase):
     def factory(self, **kwargs):
         '''
         Build a fake Elasticsearch DSL FacetedResponse
-        and extract the facet form it
+        and extract the facet form it.
+
+        Hits are not used by facets so none is generated.
         '''
-        data = response_factory(**kwargs)
+        data = response_factory(nb=0, **kwargs)
 
         class TestSearch(search.SearchQuery):
             facets = {
@@ -811,6 +864,12 @@ class TestTermsFacet(FacetTestCase):
     def setUp(self):
         self.facet = search.TermsFacet(field='tags')
 
+    def test_aggregation_options(self):
+        facet = search.TermsFacet(field='tags', execution_hint='map')
+        self.assertEqual(facet.get_aggregation().to_dict(), {
+            'terms': {'field': 'tags', 'execution_hint': 'map'}
+        })
+
     def test_get_values(self):
         buckets = [{
             'key': faker.word(),
@@ -906,7 +965,7 @@ class TestModelTermsFacet(FacetTestCase, DBTestMixin):
         )
 
     def test_get_values(self):
-        fakes = [FakeFactory() for _ in range(10)]
+        fakes = Fake.objects.insert(FakeFactory.build_batch(10))
         buckets = [{
             'key': str(f.id),
             'doc_count': faker.random_number(2)
@@ -974,7 +1033,8 @@ class TestModelTermsFacetWithStringId(FacetTestCase, DBTestMixin):
         )
 
     def test_get_values(self):
-        fakes = [FakeWithStringIdFactory() for _ in range(10)]
+        fakes = FakeWithStringId.objects.insert(
+            FakeWithStringIdFactory.build_batch(10))
         buckets = [{
             'key': str(f.id),
             'doc_count': faker.random_number(2)
@@ -1118,6 +1178,15 @@ class TestTemporalCoverageFacet(FacetTestCase):
         self.assertEqual(result['max'], today)
         self.assertEqual(result['days'], 2.0)
 
+    def test_get_values_empty(self):
+        result = self.factory(aggregations={'test': {
+            'min_start': {'value': float('inf'),
+                          'value_as_string': 'Infinity'},
+            'max_end': {'value': float('-inf'),
+                        'value_as_string': '-Infinity'},
+        }})
+        self.assertIsNone(result)
+
     def test_value_filter(self):
         value_filter = self.facet.get_value_filter('2013-01-07-2014-06-07')
         q_start = Q({'range': {'some_field.start': {
@@ -1238,6 +1307,10 @@ class SearchAdaptorTest(SearchTestMixin, TestCase):
         self.assert_tokens(
             'test l\'apostrophe',
             ['test l\'apostrophe', 'test apostrophe', 'test', 'apostrophe'])
+        self.assert_tokens(
+            'test l\u2019apostrophe',
+            ['test l\u2019apostrophe', 'test apostrophe',
+             'test', 'apostrophe'])
 
     def assertHasArgument(self, parser, name, _type, choices=None):
         candidates = [
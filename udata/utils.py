@@ -10,7 +10,6 @@ import factory
 from uuid import uuid4
 from datetime import date, datetime
 from calendar import monthrange
-from math import ceil
 from faker import Faker
 from faker.config import PROVIDERS
 from faker.providers import BaseProvider
@@ -50,7 +49,8 @@ class Paginable(object):
     @property
     def pages(self):
         if self.page_size:
-            return int(ceil(self.total / float(self.page_size)))
+            # Integer ceil division
+            return int((self.total + self.page_size - 1) // self.page_size)
         else:
             return 1
 